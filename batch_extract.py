@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Headless batch extraction over a directory of PDFs
+
+Spreads the PDFs over a pool of workers, each loading documents into its own
+fresh browser context (isolated storage and caches), and waits on the app's
+readiness signal (document.body.dataset.pdfState) instead of fixed sleeps.
+Every document produces one NDJSON line with its preprocessing results
+(sections, tables, citations) and the cell contents of each detected table,
+read from the text layer by TextLayerTableParser. CDN scripts (pdf.js, pdf-lib)
+are served from --asset-cache once a first online run has filled it.
+
+Usage:
+    python3 batch_extract.py pdfs/ --workers 4 --output /tmp/extractions.ndjson
+    python3 batch_extract.py --synthetic 24 --workers 1   # throughput baseline on
+    python3 batch_extract.py --synthetic 24 --workers 8   # generated PDFs (synthetic_pdfs.py)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from playwright.async_api import async_playwright
+
+from benchmark_suite import CDN_HOSTS, DEFAULT_ASSET_CACHE, cached_asset_path, fulfill_options, store_asset
+from benchmark_tables import start_server
+from synthetic_pdfs import generate_document
+
+READY_STATES = ('ready', 'analysis-failed', 'failed')
+
+COLLECT_SCRIPT = """
+async (parseTables) => {
+    const data = window.AppStateManager.peek().preprocessingData;
+    if (!data) return { preprocessing: null, tables: [] };
+
+    // Per-page text records are large and only useful inside the app
+    const { pages, ...preprocessing } = data;
+    const tables = [];
+    if (parseTables) {
+        for (const table of data.tables.filter(table => table.source === 'geometry')) {
+            const parsed = await window.TextLayerTableParser.parseRegion(table.bounds, table.page, 1);
+            tables.push({
+                page: table.page,
+                label: table.label,
+                bounds: table.bounds,
+                headers: parsed ? parsed.headers : [],
+                rows: parsed ? parsed.rows : [],
+                confidence: parsed ? parsed.metadata.confidence : 0
+            });
+        }
+    }
+    return { preprocessing, tables };
+}
+"""
+
+
+async def serve_cdn_from_cache(context, cache_dir):
+    """Async twin of benchmark_suite.serve_cdn_from_cache"""
+    async def handle(route):
+        path = cached_asset_path(cache_dir, route.request.url)
+        if os.path.isfile(path):
+            await route.fulfill(**fulfill_options(path))
+            return
+        try:
+            response = await route.fetch()
+        except Exception:
+            await route.abort()
+            return
+        if response.ok:
+            store_asset(path, await response.body())
+        await route.fulfill(response=response)
+
+    for host in CDN_HOSTS:
+        await context.route(f'https://{host}/**', handle)
+
+
+async def extract_document(browser, url, pdf_path, timeout_ms, parse_tables, asset_cache):
+    """Load one PDF in a fresh context and collect its results"""
+    context = await browser.new_context()
+    await serve_cdn_from_cache(context, asset_cache)
+    try:
+        page = await context.new_page()
+        page.on('dialog', lambda dialog: asyncio.ensure_future(dialog.accept()))  # large-file confirm()
+
+        await page.goto(url)
+        await page.wait_for_function('() => window.pdfjsLib && window.AppStateManager && window.TextLayerTableParser')
+        await page.set_input_files('#pdf-file', pdf_path)
+        await page.wait_for_function(
+            f"() => {json.dumps(list(READY_STATES))}.includes(document.body.dataset.pdfState)",
+            timeout=timeout_ms,
+        )
+
+        pdf_state = await page.evaluate('() => document.body.dataset.pdfState')
+        collected = await page.evaluate(COLLECT_SCRIPT, parse_tables) if pdf_state != 'failed' else {}
+        return {'pdfState': pdf_state, **collected}
+    finally:
+        await context.close()
+
+
+async def worker(index, browser, url, queue, results, options):
+    while True:
+        try:
+            pdf_path = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+        started = time.perf_counter()
+        record = {'file': os.path.basename(pdf_path), 'path': pdf_path, 'worker': index}
+        try:
+            record.update(await extract_document(browser, url, pdf_path, options['timeout_ms'],
+                                                 options['parse_tables'], options['asset_cache']))
+            record['status'] = 'ok' if record['pdfState'] == 'ready' else record['pdfState']
+        except Exception as error:  # a bad PDF must not stop the batch
+            record.update({'status': 'error', 'error': str(error).splitlines()[0]})
+        record['seconds'] = round(time.perf_counter() - started, 3)
+
+        await results.put(record)
+        symbol = '✅' if record['status'] == 'ok' else '❌'
+        print(f"   {symbol} [{index}] {record['file']} ({record['seconds']:.1f}s, {record['status']})")
+
+
+async def writer(results, output, count):
+    """Single writer so NDJSON lines never interleave"""
+    summary = {'ok': 0, 'failed': 0}
+    with open(output, 'w') as handle:
+        for _ in range(count):
+            record = await results.get()
+            handle.write(json.dumps(record) + '\n')
+            handle.flush()
+            summary['ok' if record['status'] == 'ok' else 'failed'] += 1
+    return summary
+
+
+async def run_batch(pdf_paths, workers, output, port, timeout_ms, parse_tables,
+                    asset_cache=DEFAULT_ASSET_CACHE, headless=True):
+    server = start_server(port)
+    url = f'http://localhost:{port}/Clinical_Study_Extraction.html'
+    queue = asyncio.Queue()
+    for path in pdf_paths:
+        queue.put_nowait(path)
+    results = asyncio.Queue()
+    options = {'timeout_ms': timeout_ms, 'parse_tables': parse_tables, 'asset_cache': asset_cache}
+
+    started = time.perf_counter()
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            write_task = asyncio.create_task(writer(results, output, len(pdf_paths)))
+            await asyncio.gather(*(worker(i, browser, url, queue, results, options)
+                                   for i in range(min(workers, len(pdf_paths)))))
+            summary = await write_task
+            await browser.close()
+    finally:
+        server.shutdown()
+
+    elapsed = time.perf_counter() - started
+    summary.update({
+        'documents': len(pdf_paths),
+        'workers': workers,
+        'seconds': round(elapsed, 2),
+        'documentsPerMinute': round(len(pdf_paths) / elapsed * 60, 2) if elapsed else 0,
+    })
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract a directory of PDFs headlessly in parallel')
+    parser.add_argument('input_dir', nargs='?', help='directory containing PDFs (searched recursively)')
+    parser.add_argument('--synthetic', type=int, default=0, help='generate this many synthetic PDFs instead')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='concurrent browser contexts (default: half the CPU cores)')
+    parser.add_argument('--output', default='/tmp/batch_extractions.ndjson')
+    parser.add_argument('--port', type=int, default=8770)
+    parser.add_argument('--timeout', type=float, default=180, help='seconds allowed per document')
+    parser.add_argument('--no-tables', action='store_true', help='skip text-layer parsing of detected tables')
+    parser.add_argument('--asset-cache', default=DEFAULT_ASSET_CACHE,
+                        help='local copies of the CDN scripts (filled on the first online run)')
+    parser.add_argument('--headed', action='store_true', help='show the browser window')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        args.input_dir = tempfile.mkdtemp(prefix='synthetic_pdfs_')
+        for index in range(args.synthetic):
+            pdf_bytes, _ = generate_document(index)
+            with open(os.path.join(args.input_dir, f'synthetic_{index:03d}.pdf'), 'wb') as handle:
+                handle.write(pdf_bytes)
+    elif not args.input_dir:
+        parser.error('input_dir is required unless --synthetic is given')
+
+    pdf_paths = sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(args.input_dir)
+        for name in names if name.lower().endswith('.pdf')
+    )
+    if not pdf_paths:
+        print(f"❌ No PDFs found in {args.input_dir}")
+        sys.exit(1)
+
+    print(f"📚 Extracting {len(pdf_paths)} PDFs with {args.workers} workers...")
+    summary = asyncio.run(run_batch(
+        pdf_paths, args.workers, args.output, args.port,
+        int(args.timeout * 1000), not args.no_tables, asset_cache=args.asset_cache, headless=not args.headed,
+    ))
+
+    print("\n" + "=" * 60)
+    print("📊 BATCH EXTRACTION")
+    print("=" * 60)
+    print(f"Documents: {summary['documents']}  OK: {summary['ok']}  Failed: {summary['failed']}")
+    print(f"Workers: {summary['workers']}  Wall time: {summary['seconds']:.1f}s  "
+          f"Throughput: {summary['documentsPerMinute']:.1f} documents/minute")
+    print(f"💾 Results saved to {args.output}")
+
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
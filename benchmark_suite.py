@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Reproducible performance benchmark for loading, analysis, rendering and search
+
+Generates deterministic synthetic PDFs (synthetic_pdfs.py) at several sizes,
+with dense tables and a numbered reference list, and drives the app headlessly
+through the same inputs a user would. Timings come from the app's PerfTracer
+spans, enabled with ?perf=1 and read back as User Timing measures (pdf:load,
+pdf:analyze, preprocess:* stages, cache:read, pdf:render-page,
+pdf:search-index, pdf:search), and JS heap size from the Chrome DevTools
+Protocol after a forced garbage collection. Every run gets a fresh browser
+context so no analysis or AI cache carries over between repeats.
+
+Results are written as JSON; with --baseline each metric's median is compared
+against a saved run and the script exits 1 when one regresses by more than
+the threshold, so it can gate a release.
+
+The app loads pdf.js, its cMaps and pdf-lib from CDNs. The first run needs
+network access and stores those files in --asset-cache; later runs serve them
+from there through page routing and work offline.
+
+Usage:
+    python3 benchmark_suite.py --save-baseline /tmp/benchmark_baseline.json
+    python3 benchmark_suite.py --baseline /tmp/benchmark_baseline.json --threshold 0.2
+    python3 benchmark_suite.py --sizes 10,100 --repeat 5
+"""
+
+import argparse
+import json
+import mimetypes
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import urllib.parse
+
+from playwright.sync_api import sync_playwright
+
+from benchmark_tables import percentile, start_server
+from synthetic_pdfs import generate_document
+
+READY_STATES = ('ready', 'analysis-failed', 'failed')
+CDN_HOSTS = ('cdnjs.cloudflare.com', 'cdn.jsdelivr.net')
+DEFAULT_ASSET_CACHE = os.path.expanduser('~/.cache/clinical-study-extraction/cdn')
+SEARCH_QUERIES = ['mortality', 'decompression', 'Neurosurgery', 'functional outcome', 'p value']
+DEFAULT_SEED = 24
+
+OPERATIONS_SCRIPT = """
+async ({ pages, queries }) => {
+    for (const pageNum of pages) {
+        await window.PDFRenderer.renderPage(pageNum);
+    }
+    const input = document.getElementById('search-query');
+    for (const query of queries) {
+        input.value = query;
+        await window.searchInPDF();
+    }
+}
+"""
+
+MEASURES_SCRIPT = """
+() => performance.getEntriesByType('measure')
+    .map(entry => ({ name: entry.name, duration: entry.duration, detail: entry.detail }))
+"""
+
+
+def corpus_document(size, seed):
+    """Same bytes for the same (size, seed) on every machine"""
+    return generate_document(seed * 10000 + size, size, table_rate=0.6, reference_pages=max(1, size // 25))
+
+
+def cached_asset_path(cache_dir, url):
+    parsed = urllib.parse.urlsplit(url)
+    return os.path.join(cache_dir, parsed.netloc, parsed.path.lstrip('/'))
+
+
+def fulfill_options(path):
+    return {
+        'path': path,
+        'content_type': mimetypes.guess_type(path)[0] or 'application/octet-stream',
+        'headers': {'Access-Control-Allow-Origin': '*'},  # the pdf.js worker is fetched cross-origin
+    }
+
+
+def store_asset(path, body):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as handle:
+        handle.write(body)
+
+
+def serve_cdn_from_cache(context, cache_dir):
+    """Answer CDN requests from cache_dir, downloading (and keeping) whatever is missing"""
+    def handle(route):
+        path = cached_asset_path(cache_dir, route.request.url)
+        if os.path.isfile(path):
+            route.fulfill(**fulfill_options(path))
+            return
+        try:
+            response = route.fetch()
+        except Exception as error:
+            print(f"   ⚠️  {route.request.url} is not cached and could not be downloaded: {error}")
+            route.abort()
+            return
+        if response.ok:
+            store_asset(path, response.body())
+        route.fulfill(response=response)
+
+    for host in CDN_HOSTS:
+        context.route(f'https://{host}/**', handle)
+
+
+def heap_used_mb(cdp):
+    """JS heap in use after a full garbage collection"""
+    cdp.send('HeapProfiler.collectGarbage')
+    metrics = {metric['name']: metric['value'] for metric in cdp.send('Performance.getMetrics')['metrics']}
+    return metrics['JSHeapUsedSize'] / (1024 * 1024)
+
+
+def sample_pages(page_count):
+    """First, middle and last page plus one inside the reference list"""
+    return sorted({1, max(1, page_count // 2), page_count, max(1, page_count - 1)})
+
+
+def run_once(browser, url, pdf_path, page_count, timeout_ms, asset_cache):
+    """Load one document in a fresh context, exercise it and return its measures"""
+    context = browser.new_context()
+    serve_cdn_from_cache(context, asset_cache)
+    try:
+        page = context.new_page()
+        page.on('dialog', lambda dialog: dialog.accept())  # large-file confirm()
+        cdp = context.new_cdp_session(page)
+        cdp.send('Performance.enable')
+
+        page.goto(url)
+        page.wait_for_function('() => window.pdfjsLib && window.PDFRenderer && window.searchInPDF')
+        baseline_heap = heap_used_mb(cdp)
+
+        started = time.perf_counter()
+        page.set_input_files('#pdf-file', pdf_path)
+        page.wait_for_function(
+            f"() => {json.dumps(list(READY_STATES))}.includes(document.body.dataset.pdfState)",
+            timeout=timeout_ms,
+        )
+        pdf_state = page.evaluate('() => document.body.dataset.pdfState')
+        if pdf_state != 'ready':
+            raise RuntimeError(f'document ended in state {pdf_state!r}')
+        ready_seconds = time.perf_counter() - started
+        loaded_heap = heap_used_mb(cdp)
+
+        page.evaluate(OPERATIONS_SCRIPT, {'pages': sample_pages(page_count), 'queries': SEARCH_QUERIES})
+        measures = page.evaluate(MEASURES_SCRIPT)
+        final_heap = heap_used_mb(cdp)
+        cdp.detach()
+
+        return {
+            'measures': measures,
+            'readySeconds': ready_seconds,
+            'heapLoadedMB': loaded_heap - baseline_heap,
+            'heapFinalMB': final_heap - baseline_heap,
+        }
+    finally:
+        context.close()
+
+
+def summarize(values):
+    return {
+        'median': round(statistics.median(values), 3),
+        'p95': round(percentile(values, 0.95), 3),
+        'min': round(min(values), 3),
+        'count': len(values),
+    }
+
+
+def run_suite(sizes, repeat, seed, port, timeout_ms, asset_cache=DEFAULT_ASSET_CACHE, headless=True):
+    server = start_server(port)
+    url = f'http://localhost:{port}/Clinical_Study_Extraction.html?perf=1'
+    corpus_dir = tempfile.mkdtemp(prefix='benchmark_suite_')
+    results = {}
+
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=headless)
+            print(f"🌐 {browser.version} — {repeat} run(s) per document")
+
+            for size in sizes:
+                pdf_bytes, truth = corpus_document(size, seed)
+                pdf_path = os.path.join(corpus_dir, f'benchmark_{size}p.pdf')
+                with open(pdf_path, 'wb') as handle:
+                    handle.write(pdf_bytes)
+                print(f"📄 {size} pages, {len(truth['tables'])} tables, {truth['references']} references "
+                      f"({len(pdf_bytes) / 1024 / 1024:.1f} MB)")
+
+                timings, memory = {}, {'heapLoadedMB': [], 'heapFinalMB': [], 'readySeconds': []}
+                for run in range(repeat):
+                    sample = run_once(browser, url, pdf_path, size, timeout_ms, asset_cache)
+                    for measure in sample['measures']:
+                        timings.setdefault(measure['name'], []).append(measure['duration'])
+                    for key in memory:
+                        memory[key].append(sample[key])
+                    print(f"   ⏱️  run {run + 1}/{repeat}: ready in {sample['readySeconds']:.2f}s, "
+                          f"heap +{sample['heapFinalMB']:.1f} MB")
+
+                results[str(size)] = {
+                    'document': {'pages': size, 'tables': len(truth['tables']),
+                                 'references': truth['references'], 'bytes': len(pdf_bytes)},
+                    'timingsMs': {name: summarize(values) for name, values in sorted(timings.items())},
+                    'memoryMB': {key: summarize(values) for key, values in memory.items() if key != 'readySeconds'},
+                    'readySeconds': summarize(memory['readySeconds']),
+                }
+
+            browser_version = browser.version
+            browser.close()
+    finally:
+        server.shutdown()
+
+    return {
+        'createdAt': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': {
+            'browser': browser_version,
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'cpus': os.cpu_count(),
+        },
+        'config': {'sizes': sizes, 'repeat': repeat, 'seed': seed, 'queries': SEARCH_QUERIES},
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold, heap_threshold, min_delta_ms):
+    """Median-vs-median comparison; returns a list of regression descriptions"""
+    regressions = []
+    for size, result in current['results'].items():
+        previous = baseline.get('results', {}).get(size)
+        if not previous:
+            print(f"   ⚠️  {size} pages: not in baseline, skipped")
+            continue
+
+        checks = [(f'timingsMs.{name}', stats['median'], previous['timingsMs'].get(name, {}).get('median'),
+                   threshold, min_delta_ms) for name, stats in result['timingsMs'].items()]
+        checks += [(f'memoryMB.{name}', stats['median'], previous['memoryMB'].get(name, {}).get('median'),
+                    heap_threshold, 1.0) for name, stats in result['memoryMB'].items()]
+
+        for metric, now, before, limit, noise_floor in checks:
+            if before is None:
+                continue
+            change = (now - before) / before if before > 0 else 0
+            regressed = change > limit and now - before > noise_floor
+            symbol = '❌' if regressed else '✅'
+            print(f"   {symbol} {size:>5}p {metric:<28} {before:>10.2f} → {now:>10.2f} ({change:+.1%})")
+            if regressed:
+                regressions.append(f"{size} pages {metric}: {before:.2f} → {now:.2f} ({change:+.1%}, limit {limit:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark load, analysis, render and search performance')
+    parser.add_argument('--sizes', default='10,100,1000', help='comma-separated page counts')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per document (medians are compared)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--port', type=int, default=8771)
+    parser.add_argument('--timeout', type=float, default=600, help='seconds allowed for a document to become ready')
+    parser.add_argument('--output', default='/tmp/benchmark_suite.json')
+    parser.add_argument('--baseline', help='compare against this earlier result file')
+    parser.add_argument('--save-baseline', help='also write the results here as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown of a median (0.2 = 20%%)')
+    parser.add_argument('--heap-threshold', type=float, default=0.25, help='allowed heap growth of a median')
+    parser.add_argument('--min-delta-ms', type=float, default=5.0, help='ignore timing changes smaller than this')
+    parser.add_argument('--asset-cache', default=DEFAULT_ASSET_CACHE,
+                        help='local copies of the CDN scripts (filled on the first online run)')
+    parser.add_argument('--headed', action='store_true', help='show the browser window')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = run_suite(sizes, args.repeat, args.seed, args.port, int(args.timeout * 1000),
+                        asset_cache=args.asset_cache, headless=not args.headed)
+
+    print("\n" + "=" * 60)
+    print("📊 PERFORMANCE BENCHMARK")
+    print("=" * 60)
+    for size, result in results['results'].items():
+        print(f"{size} pages:")
+        for name, stats in result['timingsMs'].items():
+            print(f"   {name:<22} median {stats['median']:>9.1f} ms   p95 {stats['p95']:>9.1f} ms   (n={stats['count']})")
+        memory = result['memoryMB']
+        print(f"   JS heap                loaded +{memory['heapLoadedMB']['median']:.1f} MB   "
+              f"after render/search +{memory['heapFinalMB']['median']:.1f} MB")
+
+    with open(args.output, 'w') as handle:
+        json.dump(results, handle, indent=2)
+    print(f"💾 Results saved to {args.output}")
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as handle:
+            json.dump(results, handle, indent=2)
+        print(f"📌 Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        if baseline.get('config', {}).get('seed') != args.seed:
+            print("⚠️  Baseline used a different seed; documents are not identical")
+        print(f"\n🔍 Comparing with {args.baseline} (recorded {baseline.get('createdAt', 'unknown')})")
+        regressions = compare(results, baseline, args.threshold, args.heap_threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s):")
+            for regression in regressions:
+                print(f"   - {regression}")
+            sys.exit(1)
+        print("\n✅ No regressions beyond the thresholds")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark table detection on a synthetic corpus
+
+Generates table-heavy PDFs with known ground truth (synthetic_pdfs.py), runs
+the app's own PDFStructureAnalyzer in the browser page by page, and reports
+accuracy (precision/recall/F1 at IoU >= 0.5, row/column/caption agreement)
+alongside per-page detection time.
+
+Usage:
+    python3 benchmark_tables.py --count 20 --output /tmp/table_benchmark.json
+    python3 benchmark_tables.py --min-f1 0.9    # exit 1 if accuracy regresses
+"""
+
+import argparse
+import base64
+import functools
+import http.server
+import json
+import os
+import statistics
+import sys
+import threading
+
+from playwright.sync_api import sync_playwright
+
+from synthetic_pdfs import generate_document
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DETECT_SCRIPT = """
+async (pdfBase64) => {
+    const bytes = Uint8Array.from(atob(pdfBase64), ch => ch.charCodeAt(0));
+    const pdfDoc = await window.pdfjsLib.getDocument({ data: bytes }).promise;
+    const analyzer = window.PDFStructureAnalyzer;
+    const pages = [];
+
+    for (let pageNum = 1; pageNum <= pdfDoc.numPages; pageNum++) {
+        const readStart = performance.now();
+        const rawPage = await analyzer.readPage(pdfDoc, pageNum);
+        const readMs = performance.now() - readStart;
+
+        const detectStart = performance.now();
+        const tables = analyzer.detectTablesOnPage(analyzer.buildPage(rawPage));
+        const detectMs = performance.now() - detectStart;
+
+        pages.push({ pageNum, readMs, detectMs, items: rawPage.textItems.length, tables });
+    }
+
+    await pdfDoc.destroy();
+    return pages;
+}
+"""
+
+
+def start_server(port):
+    """Serve the repository so the app loads exactly as in the other test scripts"""
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=REPO_DIR)
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(('localhost', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def iou(a, b):
+    """Intersection over union of two {x, y, width, height} boxes"""
+    x1, y1 = max(a['x'], b['x']), max(a['y'], b['y'])
+    x2 = min(a['x'] + a['width'], b['x'] + b['width'])
+    y2 = min(a['y'] + a['height'], b['y'] + b['height'])
+    intersection = max(0, x2 - x1) * max(0, y2 - y1)
+    union = a['width'] * a['height'] + b['width'] * b['height'] - intersection
+    return intersection / union if union > 0 else 0
+
+
+def score_page(truth_tables, detected):
+    """Greedy IoU matching of detected geometry tables against ground truth"""
+    detected = [table for table in detected if table.get('source') == 'geometry']
+    used = set()
+    result = {'tp': 0, 'fn': 0, 'fp': 0, 'rows': 0, 'columns': 0, 'captions': 0, 'iou': []}
+
+    for truth in truth_tables:
+        best, best_iou = None, 0
+        for index, table in enumerate(detected):
+            overlap = iou(truth['bounds'], table['bounds'])
+            if index not in used and overlap > best_iou:
+                best, best_iou = index, overlap
+        if best is None or best_iou < 0.5:
+            result['fn'] += 1
+            continue
+
+        used.add(best)
+        table = detected[best]
+        result['tp'] += 1
+        result['iou'].append(best_iou)
+        result['rows'] += table['rowCount'] == len(truth['rows'])
+        result['columns'] += table['columnCount'] == len(truth['columns'])
+        result['captions'] += table['number'] == truth['number']
+
+    result['fp'] = len(detected) - len(used)
+    return result
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0
+
+
+def run_benchmark(count, page_count, seed, port, headless=True):
+    server = start_server(port)
+    totals = {'tp': 0, 'fn': 0, 'fp': 0, 'rows': 0, 'columns': 0, 'captions': 0, 'iou': []}
+    read_times, detect_times = [], []
+
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=headless)
+            page = browser.new_page()
+
+            print("🌐 Opening application...")
+            page.goto(f'http://localhost:{port}/Clinical_Study_Extraction.html')
+            page.wait_for_load_state('networkidle')
+            page.wait_for_function('() => window.pdfjsLib && window.PDFStructureAnalyzer')
+
+            for index in range(count):
+                pdf_bytes, truth = generate_document(seed * 1000 + index, page_count)
+                pages = page.evaluate(DETECT_SCRIPT, base64.b64encode(pdf_bytes).decode('ascii'))
+
+                for page_result in pages:
+                    truth_tables = [t for t in truth['tables'] if t['page'] == page_result['pageNum']]
+                    scored = score_page(truth_tables, page_result['tables'])
+                    for key in ('tp', 'fn', 'fp', 'rows', 'columns', 'captions'):
+                        totals[key] += scored[key]
+                    totals['iou'].extend(scored['iou'])
+                    read_times.append(page_result['readMs'])
+                    detect_times.append(page_result['detectMs'])
+
+                print(f"   📄 Document {index + 1}/{count}: {len(truth['tables'])} tables")
+
+            browser.close()
+    finally:
+        server.shutdown()
+
+    tp, fp, fn = totals['tp'], totals['fp'], totals['fn']
+    precision = tp / (tp + fp) if tp + fp else 0
+    recall = tp / (tp + fn) if tp + fn else 0
+    return {
+        'documents': count,
+        'pages': len(detect_times),
+        'tables': tp + fn,
+        'accuracy': {
+            'precision': round(precision, 4),
+            'recall': round(recall, 4),
+            'f1': round(2 * precision * recall / (precision + recall), 4) if precision + recall else 0,
+            'meanIoU': round(statistics.mean(totals['iou']), 4) if totals['iou'] else 0,
+            'rowCountAccuracy': round(totals['rows'] / tp, 4) if tp else 0,
+            'columnCountAccuracy': round(totals['columns'] / tp, 4) if tp else 0,
+            'captionAccuracy': round(totals['captions'] / tp, 4) if tp else 0,
+        },
+        'timing': {
+            'detectMeanMs': round(statistics.mean(detect_times), 3) if detect_times else 0,
+            'detectP95Ms': round(percentile(detect_times, 0.95), 3),
+            'readMeanMs': round(statistics.mean(read_times), 3) if read_times else 0,
+            'readP95Ms': round(percentile(read_times, 0.95), 3),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark table detection accuracy and speed')
+    parser.add_argument('--count', type=int, default=20, help='number of synthetic documents')
+    parser.add_argument('--pages', type=int, default=6, help='pages per document')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--output', default='/tmp/table_benchmark.json')
+    parser.add_argument('--min-f1', type=float, default=None, help='fail if F1 drops below this')
+    parser.add_argument('--headed', action='store_true', help='show the browser window')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.count, args.pages, args.seed, args.port, headless=not args.headed)
+
+    accuracy, timing = results['accuracy'], results['timing']
+    print("\n" + "=" * 60)
+    print("📊 TABLE DETECTION BENCHMARK")
+    print("=" * 60)
+    print(f"Documents: {results['documents']}  Pages: {results['pages']}  Tables: {results['tables']}")
+    print(f"Precision {accuracy['precision']:.3f}  Recall {accuracy['recall']:.3f}  F1 {accuracy['f1']:.3f}  "
+          f"mean IoU {accuracy['meanIoU']:.3f}")
+    print(f"Rows {accuracy['rowCountAccuracy']:.3f}  Columns {accuracy['columnCountAccuracy']:.3f}  "
+          f"Captions {accuracy['captionAccuracy']:.3f}")
+    print(f"Detect per page: mean {timing['detectMeanMs']:.2f} ms, p95 {timing['detectP95Ms']:.2f} ms "
+          f"(text + rulings read: mean {timing['readMeanMs']:.2f} ms)")
+
+    with open(args.output, 'w') as handle:
+        json.dump(results, handle, indent=2)
+    print(f"💾 Results saved to {args.output}")
+
+    if args.min_f1 is not None and accuracy['f1'] < args.min_f1:
+        print(f"❌ F1 {accuracy['f1']:.3f} is below the required {args.min_f1:.3f}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the AI provider APIs
+
+Serves the repository (so the app loads from the same origin) and answers
+POST /api/{gemini,anthropic,openai}[/stream] in each provider's response
+format. Streaming endpoints send Server-Sent Events one small token at a
+time, so progressive field filling and the time-to-first-token / tokens/sec
+metrics can be exercised without API keys or network access.
+
+Schema requests are answered with a JSON object that has one string per
+schema property: Gemini's responseSchema, or the JSON schema the app appends
+to the Anthropic / OpenAI system prompt. Everything else gets a prose paragraph.
+
+Usage:
+    python3 sse_stub_server.py --port 8766
+    open http://localhost:8766/Clinical_Study_Extraction.html?aiEndpoint=http://localhost:8766/api
+"""
+
+import argparse
+import functools
+import http.server
+import json
+import os
+import re
+import threading
+import time
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SUMMARY_TEXT = (
+    "This retrospective cohort study reports that in-hospital mortality was 27% after surgical "
+    "decompression. Age over 70 years, a Glasgow Coma Scale score below 8 and a hematoma volume "
+    "above 30 mL were independent predictors of poor outcome at six months."
+)
+
+
+SCHEMA_INSTRUCTION = re.compile(r'matching this JSON schema:\n(\{.*\})\s*$', re.S)
+
+
+def requested_schema(provider, payload):
+    """The JSON schema the request asks the answer to follow, if any"""
+    if provider == 'gemini':
+        return (payload.get('generationConfig') or {}).get('responseSchema')
+    if provider == 'anthropic':
+        system = payload.get('system') or ''
+    else:
+        system = next((m['content'] for m in payload.get('messages', []) if m.get('role') == 'system'), '')
+    match = SCHEMA_INSTRUCTION.search(system)
+    return json.loads(match.group(1)) if match else None
+
+
+def response_text(provider, payload):
+    """Canned answer shaped like what the app asked for"""
+    schema = requested_schema(provider, payload)
+    if schema and schema.get('properties'):
+        return json.dumps({name: f"Stub {name} from the local stand-in server" for name in schema['properties']})
+    if provider == 'openai' and payload.get('response_format', {}).get('type') == 'json_object':
+        return json.dumps({'text': SUMMARY_TEXT})
+    return SUMMARY_TEXT
+
+
+def tokens(text):
+    """Split into small pieces (roughly one token each) that join back to the original text"""
+    return re.findall(r'\s*\S{1,4}|\s+$', text)
+
+
+def full_body(provider, text, token_count):
+    if provider == 'gemini':
+        return {'candidates': [{'content': {'parts': [{'text': text}]}}],
+                'usageMetadata': {'candidatesTokenCount': token_count}}
+    if provider == 'anthropic':
+        return {'content': [{'type': 'text', 'text': text}], 'usage': {'output_tokens': token_count}}
+    return {'choices': [{'message': {'content': text}}], 'usage': {'completion_tokens': token_count}}
+
+
+def stream_events(provider, pieces):
+    """(event name or None, data) pairs in the provider's SSE format"""
+    if provider == 'anthropic':
+        yield 'message_start', {'type': 'message_start'}
+    for index, piece in enumerate(pieces):
+        if provider == 'gemini':
+            yield None, {'candidates': [{'content': {'parts': [{'text': piece}]}}],
+                         'usageMetadata': {'candidatesTokenCount': index + 1}}
+        elif provider == 'anthropic':
+            yield 'content_block_delta', {'type': 'content_block_delta', 'index': 0,
+                                          'delta': {'type': 'text_delta', 'text': piece}}
+        else:
+            yield None, {'choices': [{'index': 0, 'delta': {'content': piece}}]}
+    if provider == 'anthropic':
+        yield 'message_delta', {'type': 'message_delta', 'usage': {'output_tokens': len(pieces)}}
+        yield 'message_stop', {'type': 'message_stop'}
+    elif provider == 'openai':
+        yield None, {'choices': [], 'usage': {'completion_tokens': len(pieces)}}
+        yield None, '[DONE]'
+
+
+class StandInHandler(http.server.SimpleHTTPRequestHandler):
+    first_token_delay = 0.3
+    token_delay = 0.02
+    request_log = []
+
+    def log_message(self, *args):
+        pass
+
+    def end_headers(self):
+        self.send_header('Access-Control-Allow-Origin', '*')
+        super().end_headers()
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', '*')
+        self.end_headers()
+
+    def do_POST(self):
+        match = re.match(r'^/api/(gemini|anthropic|openai)(/stream)?(\?.*)?$', self.path)
+        if not match:
+            self.send_error(404)
+            return
+
+        provider, stream = match.group(1), bool(match.group(2))
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        self.request_log.append({'provider': provider, 'stream': stream, 'time': time.time()})
+
+        text = response_text(provider, payload)
+        pieces = tokens(text)
+        time.sleep(self.first_token_delay)
+
+        if not stream:
+            body = json.dumps(full_body(provider, text, len(pieces))).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        try:
+            for event, data in stream_events(provider, pieces):
+                chunk = f"event: {event}\n" if event else ''
+                chunk += f"data: {data if isinstance(data, str) else json.dumps(data)}\n\n"
+                self.wfile.write(chunk.encode('utf-8'))
+                self.wfile.flush()
+                time.sleep(self.token_delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the page cancelled the request
+        self.close_connection = True
+
+
+def start_server(port, first_token_delay=0.3, token_delay=0.02):
+    """Run the stand-in on a background thread; returns the server (call shutdown() when done)"""
+    handler = functools.partial(
+        type('ConfiguredHandler', (StandInHandler,), {
+            'first_token_delay': first_token_delay,
+            'token_delay': token_delay,
+            'request_log': [],
+        }),
+        directory=REPO_DIR,
+    )
+    server = http.server.ThreadingHTTPServer(('localhost', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local SSE stand-in for the AI provider APIs')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--first-token-delay', type=float, default=0.3, help='seconds before the first token')
+    parser.add_argument('--token-delay', type=float, default=0.02, help='seconds between tokens')
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.first_token_delay, args.token_delay)
+    print(f"🤖 AI stand-in running: http://localhost:{args.port}/Clinical_Study_Extraction.html"
+          f"?aiEndpoint=http://localhost:{args.port}/api")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
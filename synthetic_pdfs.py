@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Synthetic table-heavy PDF corpus with ground truth
+
+Generates seeded clinical-study-like documents (prose, captions, ruled and
+unruled tables, one- and two-column layouts, in-text "Table N shows..."
+references, optional numbered reference-list pages) without any third-party
+dependency. Every table's bounds, rows
+and columns are recorded in page coordinates (points, origin top-left) so
+benchmarks can score detection accuracy.
+
+Usage:
+    python3 synthetic_pdfs.py --out /tmp/synthetic_pdfs --count 20 --seed 7
+"""
+
+import argparse
+import json
+import os
+import random
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+MARGIN = 72
+FONT_SIZE = 10
+LEADING = 12
+
+# Helvetica advance widths (1/1000 em) for the characters the generator emits
+HELVETICA_WIDTHS = {
+    ' ': 278, '.': 278, ',': 278, ':': 278, '(': 333, ')': 333, '-': 333, '%': 889, '/': 278,
+    '±': 584, 'I': 278, 'i': 222, 'j': 222, 'l': 222, 'f': 278, 't': 278, 'r': 333,
+    'm': 833, 'w': 722, 'M': 833, 'W': 944, 'c': 500, 'k': 500, 's': 500, 'v': 500,
+    'x': 500, 'y': 500, 'z': 500, 'J': 500, 'L': 556, 'F': 611, 'T': 611, 'Z': 611,
+    'C': 722, 'D': 722, 'H': 722, 'N': 722, 'R': 722, 'U': 722, 'G': 778, 'O': 778, 'Q': 778,
+}
+
+WORDS = (
+    'patients treatment outcome cohort baseline randomized trial analysis mortality '
+    'surgery decompression infarction cerebellar follow-up months median interval '
+    'significant difference observed groups compared primary secondary endpoint '
+    'hospital stay functional score adverse events were recorded during study'
+).split()
+
+ROW_LABELS = [
+    'Age, years', 'Male sex', 'Hypertension', 'Diabetes', 'GCS on admission', 'Infarct volume',
+    'Hydrocephalus', 'Brainstem involvement', 'Time to surgery', 'mRS 0-2', 'mRS 3-6',
+    'Mortality', 'Length of stay', 'Reoperation', 'Infection', 'Ventriculostomy',
+]
+
+SURNAMES = ['Smith', 'Jauss', 'Neugebauer', 'Pfefferkorn', 'Kim', 'Chen', 'Hornig', 'Wijdicks', 'Raco', 'Tsitsopoulos']
+JOURNALS = ['Stroke', 'J Neurosurg', 'Neurosurgery', 'Acta Neurochir', 'Neurocrit Care', 'Cerebrovasc Dis']
+
+
+def text_width(text, size=FONT_SIZE):
+    """Rendered width of text in Helvetica at the given size"""
+    return sum(HELVETICA_WIDTHS.get(ch, 556) for ch in text) * size / 1000.0
+
+
+def pdf_string(text):
+    """Escape text for a PDF literal string"""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return escaped.encode('latin-1', 'replace').decode('latin-1')
+
+
+def cell_value(rng):
+    """A numeric table cell in one of the usual clinical formats"""
+    kind = rng.random()
+    if kind < 0.35:
+        return f'{rng.randint(1, 180)} ({rng.uniform(1, 99):.1f})'
+    if kind < 0.6:
+        return f'{rng.uniform(1, 90):.1f} ± {rng.uniform(0.5, 20):.1f}'
+    if kind < 0.8:
+        return f'{rng.uniform(0, 1):.3f}'
+    return str(rng.randint(0, 250))
+
+
+class PageLayout:
+    """Text runs and rules for one page, plus the ground truth of its tables"""
+
+    def __init__(self):
+        self.texts = []   # (x, baseline_from_top, text)
+        self.lines = []   # (x1, y1, x2, y2) from top
+        self.tables = []
+
+    def text(self, x, baseline, text):
+        self.texts.append((x, baseline, text))
+
+    def rule(self, x1, y1, x2, y2):
+        self.lines.append((x1, y1, x2, y2))
+
+    def content_stream(self):
+        ops = ['0.5 w']
+        for x1, y1, x2, y2 in self.lines:
+            ops.append(f'{x1:.2f} {PAGE_HEIGHT - y1:.2f} m {x2:.2f} {PAGE_HEIGHT - y2:.2f} l S')
+        for x, baseline, text in self.texts:
+            ops.append(f'BT /F1 {FONT_SIZE} Tf {x:.2f} {PAGE_HEIGHT - baseline:.2f} Td ({pdf_string(text)}) Tj ET')
+        return '\n'.join(ops).encode('latin-1')
+
+
+def write_paragraph(layout, rng, x, top, width, lines, lead_in=None):
+    """Wrapped prose; returns the y below the paragraph"""
+    baseline = top + FONT_SIZE
+    for index in range(lines):
+        words = [lead_in] if (index == 0 and lead_in) else []
+        while True:
+            word = rng.choice(WORDS)
+            if text_width(' '.join(words + [word])) > width:
+                break
+            words.append(word)
+        layout.text(x, baseline, ' '.join(words))
+        baseline += LEADING
+    return baseline - FONT_SIZE + LEADING * 0.5
+
+
+def write_table(layout, rng, number, x, top, width, style, caption_below=False):
+    """A captioned table; records ground truth and returns the y below it"""
+    column_count = rng.randint(2, 3) if width < 300 else rng.randint(3, 6)
+    row_count = rng.randint(4, 12)
+    row_pitch = rng.choice([12, 13, 14, 16])
+    caption = f'Table {number}. ' + ' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 7))).capitalize()
+    while text_width(caption) > width:
+        caption = caption.rsplit(' ', 1)[0]
+
+    y = top
+    if not caption_below:
+        layout.text(x, y + FONT_SIZE, caption)
+        y += FONT_SIZE + 8
+
+    label_width = width * (0.34 if column_count > 2 else 0.45)
+    value_width = (width - label_width) / (column_count - 1)
+    column_x = [x] + [x + label_width + value_width * c for c in range(column_count - 1)]
+    header = ['Variable'] + [rng.choice(['Surgery', 'Medical', 'Total', 'Early', 'Late', 'p value', 'OR (95% CI)'])
+                             for _ in range(column_count - 1)]
+    body = [[rng.choice(ROW_LABELS)] + [cell_value(rng) for _ in range(column_count - 1)] for _ in range(row_count)]
+
+    table_top = y
+    rows = []
+    column_right = [cx for cx in column_x]
+    if style in ('booktabs', 'grid'):
+        layout.rule(x, y, x + width, y)
+    y += 3
+
+    for index, cells in enumerate([header] + body):
+        baseline = y + FONT_SIZE
+        for c, cell in enumerate(cells):
+            while text_width(cell) > (label_width if c == 0 else value_width) - FONT_SIZE * 1.2:
+                cell = cell[:-1]
+            layout.text(column_x[c], baseline, cell)
+            column_right[c] = max(column_right[c], column_x[c] + text_width(cell))
+        rows.append({'y': round(baseline - FONT_SIZE * 0.8, 1), 'height': FONT_SIZE})
+        y += row_pitch
+        if index == 0 and style in ('booktabs', 'grid'):
+            layout.rule(x, y - row_pitch + FONT_SIZE + 3, x + width, y - row_pitch + FONT_SIZE + 3)
+            y += 3
+        elif style == 'grid':
+            layout.rule(x, y - 1, x + width, y - 1)
+
+    table_bottom = y - row_pitch + FONT_SIZE * 1.2 + 2
+    if style in ('booktabs', 'grid'):
+        layout.rule(x, table_bottom, x + width, table_bottom)
+    if style == 'grid':
+        for cx in column_x[1:]:
+            layout.rule(cx - 4, table_top, cx - 4, table_bottom)
+    right = x + width if style != 'none' else max(column_right)
+    bottom = table_bottom if style != 'none' else table_bottom - 2
+
+    y = table_bottom + 6
+    if caption_below:
+        layout.text(x, y + FONT_SIZE, caption)
+        y += FONT_SIZE + 4
+
+    layout.tables.append({
+        'number': str(number),
+        'caption': caption,
+        'style': style,
+        'bounds': {'x': round(x, 1), 'y': round(table_top, 1),
+                   'width': round(right - x, 1), 'height': round(bottom - table_top, 1)},
+        'rows': rows,
+        'columns': [{'x': round(cx, 1), 'width': round(column_right[c] - cx, 1)} for c, cx in enumerate(column_x)],
+    })
+    return y + 10
+
+
+def generate_page(rng, table_counter, table_rate=None):
+    """One page in a one- or two-column layout; table_rate overrides the chance of a table per block"""
+    layout = PageLayout()
+    two_column = rng.random() < 0.35
+    bottom_limit = PAGE_HEIGHT - MARGIN
+
+    if two_column:
+        gutter = 18
+        column_width = (PAGE_WIDTH - 2 * MARGIN - gutter) / 2
+        for column in range(2):
+            x = MARGIN + column * (column_width + gutter)
+            y = MARGIN
+            while y < bottom_limit - 60:
+                if rng.random() < (0.35 if table_rate is None else table_rate) and y < bottom_limit - 220:
+                    table_counter[0] += 1
+                    y = write_table(layout, rng, table_counter[0], x, y, column_width, rng.choice(['booktabs', 'grid', 'none']))
+                else:
+                    lines = min(rng.randint(3, 9), int((bottom_limit - y) / LEADING) - 1)
+                    if lines < 1:
+                        break
+                    y = write_paragraph(layout, rng, x, y, column_width, lines)
+        return layout
+
+    y = MARGIN
+    while y < bottom_limit - 60:
+        if rng.random() < (0.45 if table_rate is None else table_rate) and y < bottom_limit - 240:
+            table_counter[0] += 1
+            y = write_table(layout, rng, table_counter[0], MARGIN, y, PAGE_WIDTH - 2 * MARGIN,
+                            rng.choice(['booktabs', 'grid', 'none']), caption_below=rng.random() < 0.15)
+        else:
+            lines = min(rng.randint(3, 10), int((bottom_limit - y) / LEADING) - 1)
+            if lines < 1:
+                break
+            # Distractor: prose that starts like a caption
+            lead_in = f'Table {rng.randint(1, 9)} shows' if rng.random() < 0.25 else None
+            y = write_paragraph(layout, rng, MARGIN, y, PAGE_WIDTH - 2 * MARGIN, lines, lead_in)
+    return layout
+
+
+def citation(rng, number):
+    """One numbered reference in Vancouver style"""
+    authors = ', '.join(f'{rng.choice(SURNAMES)} {rng.choice("ABCDHJKMRS")}' for _ in range(rng.randint(1, 4)))
+    title = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 11))).capitalize()
+    year, volume, first_page = rng.randint(1985, 2024), rng.randint(10, 120), rng.randint(100, 2400)
+    return (f'{number}. {authors}. {title}. {rng.choice(JOURNALS)}. '
+            f'{year};{volume}({rng.randint(1, 12)}):{first_page}-{first_page + rng.randint(3, 12)}.')
+
+
+def generate_reference_page(rng, reference_counter, heading):
+    """A page of the numbered reference list, wrapped to the text width"""
+    layout = PageLayout()
+    width = PAGE_WIDTH - 2 * MARGIN
+    baseline = MARGIN + FONT_SIZE
+    if heading:
+        layout.text(MARGIN, baseline, 'References')
+        baseline += LEADING * 2
+
+    while baseline < PAGE_HEIGHT - MARGIN - LEADING * 3:
+        reference_counter[0] += 1
+        words, lines = citation(rng, reference_counter[0]).split(' '), []
+        while words:
+            line = words.pop(0)
+            while words and text_width(f'{line} {words[0]}') <= width - 14:
+                line += ' ' + words.pop(0)
+            lines.append(line)
+        for index, line in enumerate(lines):
+            layout.text(MARGIN + (14 if index else 0), baseline, line)
+            baseline += LEADING
+        baseline += 3
+    return layout
+
+
+def build_pdf(layouts):
+    """Serialize page layouts into a PDF using the built-in Helvetica font"""
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(None)
+    pages_id = add(None)
+    font_id = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+    page_ids = []
+    for layout in layouts:
+        stream = layout.content_stream()
+        content_id = add(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        page_ids.append(add(
+            f'<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] '
+            f'/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>'.encode()
+        ))
+    objects[catalog - 1] = f'<< /Type /Catalog /Pages {pages_id} 0 R >>'.encode()
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects[pages_id - 1] = f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'.encode()
+
+    output = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f'{number} 0 obj\n'.encode() + body + b'\nendobj\n'
+    xref = len(output)
+    output += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    for offset in offsets:
+        output += f'{offset:010d} 00000 n \n'.encode()
+    output += f'trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    return bytes(output)
+
+
+def generate_document(seed, page_count=6, table_rate=None, reference_pages=0):
+    """Return (pdf_bytes, ground_truth) for one seeded document
+
+    The last reference_pages of page_count hold a numbered reference list;
+    the defaults reproduce the original table-benchmark corpus exactly.
+    """
+    rng = random.Random(seed)
+    table_counter, reference_counter = [0], [0]
+    reference_pages = min(reference_pages, page_count)
+    layouts = [generate_page(rng, table_counter, table_rate) for _ in range(page_count - reference_pages)]
+    layouts += [generate_reference_page(rng, reference_counter, heading=index == 0) for index in range(reference_pages)]
+    truth = {
+        'seed': seed,
+        'pages': page_count,
+        'tables': [dict(table, page=page_num) for page_num, layout in enumerate(layouts, start=1)
+                   for table in layout.tables],
+        'references': reference_counter[0],
+    }
+    return build_pdf(layouts), truth
+
+
+def generate_corpus(out_dir, count=20, seed=7, page_count=6):
+    """Write count PDFs plus a ground_truth.json into out_dir; returns the truth list"""
+    os.makedirs(out_dir, exist_ok=True)
+    corpus = []
+    for index in range(count):
+        pdf_bytes, truth = generate_document(seed * 1000 + index, page_count)
+        filename = f'synthetic_{index:03d}.pdf'
+        with open(os.path.join(out_dir, filename), 'wb') as handle:
+            handle.write(pdf_bytes)
+        corpus.append(dict(truth, file=filename))
+    with open(os.path.join(out_dir, 'ground_truth.json'), 'w') as handle:
+        json.dump(corpus, handle, indent=1)
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic table-heavy PDF corpus')
+    parser.add_argument('--out', default='/tmp/synthetic_pdfs')
+    parser.add_argument('--count', type=int, default=20)
+    parser.add_argument('--pages', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.out, args.count, args.seed, args.pages)
+    tables = sum(len(doc['tables']) for doc in corpus)
+    print(f"📄 Wrote {len(corpus)} PDFs ({tables} tables) to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
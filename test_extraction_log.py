@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test that extractions are recorded on a fresh browser profile
+
+With nothing in localStorage the trace log starts empty; the first extraction
+must still appear in the log, update the counters and be written to the
+extraction journal. PICO-T generation against the local AI stand-in
+(sse_stub_server.py) adds the extractions, the same way a user would.
+
+Usage:
+    python3 test_extraction_log.py
+"""
+
+import os
+import sys
+import tempfile
+
+from playwright.sync_api import sync_playwright
+
+from sse_stub_server import start_server
+from synthetic_pdfs import generate_document
+
+PORT = 8768
+
+STATE_SCRIPT = """
+() => ({
+    count: Number(document.getElementById('extraction-count').textContent),
+    rows: document.querySelectorAll('#trace-log .trace-entry').length,
+    journal: Object.keys(localStorage).filter(key => key.startsWith('clinical_extractions_journal:')).length
+})
+"""
+
+
+def test_extraction_log():
+    server = start_server(PORT, first_token_delay=0.05, token_delay=0.005)
+    pdf_bytes, _ = generate_document(2, 2)
+    pdf_path = os.path.join(tempfile.mkdtemp(), 'extraction_log_test.pdf')
+    with open(pdf_path, 'wb') as handle:
+        handle.write(pdf_bytes)
+
+    failures = []
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            context = browser.new_context()  # empty storage
+            page = context.new_page()
+            page_errors = []
+            page.on('pageerror', lambda error: page_errors.append(str(error)))
+
+            print("🌐 Opening application with empty storage...")
+            page.goto(f'http://localhost:{PORT}/Clinical_Study_Extraction.html'
+                      f'?aiEndpoint=http://localhost:{PORT}/api')
+            page.wait_for_load_state('networkidle')
+
+            before = page.evaluate(STATE_SCRIPT)
+            if before['count'] or before['journal']:
+                failures.append(f"storage was not empty: {before}")
+
+            page.set_input_files('#pdf-file', pdf_path)
+            page.wait_for_function("() => document.body.dataset.pdfState === 'ready'")
+            page.evaluate("""() => {
+                document.getElementById('ai-provider').value = 'gemini';
+                document.getElementById('ai-api-key').value = 'stand-in-api-key';
+                window.saveSettings();
+            }""")
+            page.evaluate("() => window.generatePICO({ bypassCache: true })")
+
+            after = page.evaluate(STATE_SCRIPT)
+            print(f"   📋 {after['count']} extractions, {after['rows']} log rows, {after['journal']} journal entries")
+            if after['count'] < 1:
+                failures.append("no extraction was counted")
+            if after['rows'] < 1:
+                failures.append("the trace log shows no rows")
+            if after['journal'] != after['count']:
+                failures.append(f"{after['count']} extractions but {after['journal']} journal entries")
+            failures.extend(f"page error: {error}" for error in page_errors)
+
+            browser.close()
+    finally:
+        server.shutdown()
+
+    print("\n" + "=" * 60)
+    if failures:
+        print("❌ EXTRACTION LOG TEST FAILED")
+        for failure in failures:
+            print(f"   - {failure}")
+    else:
+        print("✅ EXTRACTION LOG TEST PASSED")
+    assert not failures, '; '.join(failures)
+
+
+if __name__ == '__main__':
+    try:
+        test_extraction_log()
+    except AssertionError:
+        sys.exit(1)
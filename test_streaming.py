@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test streamed AI responses against the local SSE stand-in (sse_stub_server.py)
+
+Loads a synthetic PDF, generates PICO-T (a schema response, parsed as it
+streams) and the key-findings summary with each provider, and checks that the
+fields fill progressively (several intermediate values before the final one)
+and that time-to-first-token and tokens/sec are recorded in
+window.AIStreamMetrics.
+
+Usage:
+    python3 test_streaming.py
+"""
+
+import os
+import sys
+import tempfile
+
+from playwright.sync_api import sync_playwright
+
+from sse_stub_server import start_server
+from synthetic_pdfs import generate_document
+
+PORT = 8767
+
+# Calls an app action and samples a field until the action settles
+SAMPLE_SCRIPT = """
+async ({ action, fieldId }) => {
+    const field = document.getElementById(fieldId);
+    field.value = '';
+    const samples = [];
+    let settled = false;
+    const run = window[action]({ bypassCache: true }).finally(() => { settled = true; });
+    while (!settled) {
+        if (field.value && field.value !== samples[samples.length - 1]) samples.push(field.value);
+        await new Promise(resolve => setTimeout(resolve, 15));
+    }
+    await run;
+    return { samples, final: field.value };
+}
+"""
+
+
+def test_streaming():
+    server = start_server(PORT, first_token_delay=0.3, token_delay=0.02)
+    pdf_bytes, _ = generate_document(1, 3)
+    pdf_path = os.path.join(tempfile.mkdtemp(), 'streaming_test.pdf')
+    with open(pdf_path, 'wb') as handle:
+        handle.write(pdf_bytes)
+
+    failures = []
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            page = browser.new_page()
+
+            print("🌐 Opening application against the local AI stand-in...")
+            page.goto(f'http://localhost:{PORT}/Clinical_Study_Extraction.html'
+                      f'?aiEndpoint=http://localhost:{PORT}/api')
+            page.wait_for_load_state('networkidle')
+
+            page.set_input_files('#pdf-file', pdf_path)
+            page.wait_for_function("() => document.getElementById('total-pages').textContent === '3'")
+            print("📄 Synthetic PDF loaded")
+
+            for provider in ('gemini', 'anthropic', 'openai'):
+                page.evaluate("""provider => {
+                    document.getElementById('ai-provider').value = provider;
+                    document.getElementById('ai-api-key').value = 'stand-in-api-key';
+                    window.saveSettings();
+                }""", provider)
+
+                for action, field_id in (('generatePICO', 'eligibility-population'),
+                                         ('generateSummary', 'predictorsPoorOutcomeSurgical')):
+                    result = page.evaluate(SAMPLE_SCRIPT, {'action': action, 'fieldId': field_id})
+                    progressive = len(result['samples']) >= 3 and result['samples'][-1] == result['final']
+                    status = "✅" if progressive else "❌"
+                    print(f"   {status} {provider} {action}: {len(result['samples'])} intermediate values")
+                    if not progressive:
+                        failures.append(f"{provider} {action} did not fill progressively")
+
+            stats = page.evaluate("() => window.AIStreamMetrics.getStats()")
+            for provider, entry in stats.items():
+                print(f"   ⚡ {provider}: {entry['calls']} calls, first token "
+                      f"{entry['medianTimeToFirstTokenMs']} ms, {entry['medianTokensPerSecond']:.1f} tok/s")
+                if not entry['medianTimeToFirstTokenMs'] >= 300:
+                    failures.append(f"{provider} time to first token below the stand-in delay")
+                if not entry['medianTokensPerSecond'] > 0:
+                    failures.append(f"{provider} tokens/sec not recorded")
+
+            browser.close()
+    finally:
+        server.shutdown()
+
+    print("\n" + "=" * 60)
+    if failures:
+        print("❌ STREAMING TEST FAILED")
+        for failure in failures:
+            print(f"   - {failure}")
+    else:
+        print("✅ STREAMING TEST PASSED")
+    assert not failures, '; '.join(failures)
+
+
+if __name__ == '__main__':
+    try:
+        test_streaming()
+    except AssertionError:
+        sys.exit(1)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test text-layer table parsing of a tightly drawn selection
+
+Generates synthetic PDFs where every page carries a table and parses each
+table from its ground-truth bounds, which run from the top of the header
+glyphs to just below the last baseline. Every row must come back: text items
+are placed by their baseline, so a selection that hugs the glyphs still has
+to keep the first and last rows.
+
+Usage:
+    python3 test_text_layer_table.py
+"""
+
+import os
+import sys
+import tempfile
+
+from playwright.sync_api import sync_playwright
+
+from benchmark_tables import start_server
+from synthetic_pdfs import generate_document
+
+PORT = 8769
+
+PARSE_SCRIPT = """
+async ({ bounds, page }) => {
+    const parsed = await window.TextLayerTableParser.parseRegion(bounds, page, 1);
+    return parsed && { rows: parsed.metadata.rowCount, hasHeaders: parsed.metadata.hasHeaders };
+}
+"""
+
+
+def test_text_layer_table():
+    server = start_server(PORT)
+    failures = []
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            for seed in (3, 11):
+                pdf_bytes, truth = generate_document(seed, 2, table_rate=1)
+                if not truth['tables']:
+                    failures.append(f"seed {seed} generated no tables")
+                pdf_path = os.path.join(tempfile.mkdtemp(), f'tight_table_{seed}.pdf')
+                with open(pdf_path, 'wb') as handle:
+                    handle.write(pdf_bytes)
+
+                page = browser.new_page()
+                page.goto(f'http://localhost:{PORT}/Clinical_Study_Extraction.html')
+                page.wait_for_function("() => window.pdfjsLib && window.TextLayerTableParser")
+                page.set_input_files('#pdf-file', pdf_path)
+                page.wait_for_function("() => document.body.dataset.pdfState === 'ready'")
+
+                for table in truth['tables']:
+                    first, last = table['rows'][0], table['rows'][-1]
+                    bounds = dict(table['bounds'], y=first['y'], height=last['y'] + last['height'] - first['y'])
+                    parsed = page.evaluate(PARSE_SCRIPT, {'bounds': bounds, 'page': table['page']})
+                    found = parsed and parsed['rows'] + (1 if parsed['hasHeaders'] else 0)
+                    status = "✅" if found == len(table['rows']) else "❌"
+                    print(f"   {status} seed {seed} table {table['number']}: {found} of {len(table['rows'])} rows")
+                    if found != len(table['rows']):
+                        failures.append(f"seed {seed} table {table['number']}: {found} of {len(table['rows'])} rows")
+                page.close()
+            browser.close()
+    finally:
+        server.shutdown()
+
+    print("\n" + "=" * 60)
+    if failures:
+        print("❌ TEXT LAYER TABLE TEST FAILED")
+        for failure in failures:
+            print(f"   - {failure}")
+    else:
+        print("✅ TEXT LAYER TABLE TEST PASSED")
+    assert not failures, '; '.join(failures)
+
+
+if __name__ == '__main__':
+    try:
+        test_text_layer_table()
+    except AssertionError:
+        sys.exit(1)